@@ -1,5 +1,7 @@
 """Global pytest configuration for clipboard tests."""
 
+import pytest
+
 
 def pytest_configure(config):
     """Configure pytest to handle serial markers correctly."""
@@ -7,10 +9,21 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "serial: mark test to run serially (not in parallel)"
     )
+    config.addinivalue_line(
+        "markers", "fresh_server: run the test against its own server subprocess"
+    )
+    config.addinivalue_line(
+        "markers", "slow: spawns extra interpreters; deselect with '-m \"not slow\"'"
+    )
 
 
-def pytest_collection_modifyitems(config, items):  # pylint: disable=unused-argument
-    """Modify test items to ensure serial tests run without conflicts."""
-    # When running with pytest-xdist, warn about clipboard test conflicts
-    # The serial marker helps identify tests that may conflict in parallel
-    # Currently used for documentation/identification purposes only
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Keep serial tests on a single worker when running under pytest-xdist."""
+    # The system clipboard is shared, so with `-n auto --dist loadgroup` every
+    # serial test lands in one xdist group while the rest spread across workers
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+    for item in items:
+        if item.get_closest_marker("serial"):
+            item.add_marker(pytest.mark.xdist_group(name="clipboard"))
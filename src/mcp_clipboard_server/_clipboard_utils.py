@@ -1,42 +1,71 @@
 """Shared utilities for clipboard operations."""
 
 import logging
+import os
+from typing import Any, Callable, Dict
 
-from ._protocol_types import ToolCallResult
 from .clipboard import get_clipboard, set_clipboard
 
 logger = logging.getLogger(__name__)
 
+# Log level checks cached for the per-call paths; see refresh_log_flags()
+_DEBUG = logger.isEnabledFor(logging.DEBUG)
 
-def execute_get_clipboard() -> ToolCallResult:
+# Opt-in fixed set_clipboard reply for clients that ignore the message text
+_TERSE_REPLIES = os.getenv("MCP_TERSE_REPLIES", "false").lower() in ("true", "1", "yes")
+
+
+def refresh_log_flags() -> None:
+    """Re-read the cached log level flags after logging is reconfigured."""
+    global _DEBUG  # pylint: disable=global-statement
+    _DEBUG = logger.isEnabledFor(logging.DEBUG)
+
+
+def get_clipboard_text() -> str:
     """
-    Execute get_clipboard operation and return standardized result.
+    Execute get_clipboard operation and return the reply text.
 
     Returns:
-        ToolCallResult containing the clipboard content in MCP format.
+        Current clipboard content.
     """
     content = get_clipboard()
-    logger.debug("Retrieved clipboard content: %s characters", len(content))
-    return {"content": [{"type": "text", "text": content}]}
+    if _DEBUG:
+        logger.debug("Retrieved clipboard content: %s characters", len(content))
+    return content
 
 
-def execute_set_clipboard(text: str) -> ToolCallResult:
+def set_clipboard_text(text: str) -> str:
     """
-    Execute set_clipboard operation and return standardized result.
+    Execute set_clipboard operation and return the reply text.
 
     Args:
         text: Text to set in clipboard.
 
     Returns:
-        ToolCallResult containing success message in MCP format.
+        Success message for the tool result.
     """
+    length = len(text)
     set_clipboard(text)
-    logger.debug("Set clipboard content: %s characters", len(text))
-    return {
-        "content": [
-            {
-                "type": "text",
-                "text": f"Successfully copied {len(text)} characters to clipboard",
-            }
-        ]
-    }
+    if _DEBUG:
+        logger.debug("Set clipboard content: %s characters", length)
+    if _TERSE_REPLIES:
+        return "ok"
+    return f"Successfully copied {length} characters to clipboard"
+
+
+def _run_get_clipboard(_arguments: Dict[str, Any]) -> str:
+    """Run get_clipboard with already-validated arguments."""
+    return get_clipboard_text()
+
+
+def _run_set_clipboard(arguments: Dict[str, Any]) -> str:
+    """Run set_clipboard with already-validated arguments."""
+    return set_clipboard_text(arguments["text"])
+
+
+# Tool name to executor returning the result text, so dispatch is a single
+# dict lookup; callers wrap the text in a ToolCallResult or serialize it
+TOOL_EXECUTORS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "get_clipboard": _run_get_clipboard,
+    "set_clipboard": _run_set_clipboard,
+}
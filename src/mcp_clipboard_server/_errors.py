@@ -1,10 +1,10 @@
 """Centralized error handling and code definitions for MCP server."""
 
-import json
 import logging
 from typing import Any, Callable, Dict, Optional, Type, Union
 
 from ._validators import ValidationException
+from .protocol import create_error_response
 
 
 class ClipboardError(Exception):
@@ -108,38 +108,7 @@ def create_error_response_for_exception(request_id: Any, exception: Exception) -
     # Log the error for debugging
     logger.error("Error %s: %s", error_code, error_message, exc_info=exception)
 
-    # Create error response locally to avoid circular import
-    response = {
-        "jsonrpc": "2.0",
-        "id": request_id,
-        "error": {"code": error_code, "message": error_message},
-    }
-    return json.dumps(response)
-
-
-def safe_execute(
-    request_id: Any, operation: Callable[..., Any], *args, **kwargs
-) -> str:
-    """
-    Safely execute an operation and return appropriate response.
-
-    Args:
-        request_id: The ID from the original request.
-        operation: The operation to execute.
-        *args: Positional arguments for the operation.
-        **kwargs: Keyword arguments for the operation.
-
-    Returns:
-        Either a success response or a JSON error response.
-    """
-    try:
-        result = operation(*args, **kwargs)
-        logger.debug("Operation executed successfully")
-        # Create success response locally to avoid circular import
-        response = {"jsonrpc": "2.0", "id": request_id, "result": result}
-        return json.dumps(response)
-    except Exception as e:  # pylint: disable=broad-except
-        return create_error_response_for_exception(request_id, e)
+    return create_error_response(request_id, error_code, error_message)
 
 
 class MCPError(Exception):
@@ -147,6 +147,10 @@ def log_request(
         params: Request parameters.
         request_id: Request ID for correlation.
     """
+    # logger.handle() skips the level check, so bail out before building anything
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     extra_fields: Dict[str, Any] = {"request_method": method, "request_id": request_id}
 
     if params is not None:
@@ -193,6 +197,10 @@ def log_response(
         request_id: Request ID for correlation.
         error_code: Error code if request failed.
     """
+    level = logging.INFO if success else logging.ERROR
+    if not logger.isEnabledFor(level):
+        return
+
     extra_fields: Dict[str, Any] = {
         "response_method": method,
         "response_success": success,
@@ -202,7 +210,6 @@ def log_response(
     if error_code is not None:
         extra_fields["error_code"] = error_code
 
-    level = logging.INFO if success else logging.ERROR
     message = f"Response: {method} - {'success' if success else 'error'}"
 
     # Create a log record with extra fields
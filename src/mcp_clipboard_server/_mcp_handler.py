@@ -3,30 +3,36 @@
 import logging
 from typing import Any, Callable, Dict, Optional
 
-from ._clipboard_utils import execute_get_clipboard, execute_set_clipboard
-from ._errors import ErrorCodes, safe_execute
+from ._clipboard_utils import TOOL_EXECUTORS
+from ._errors import ErrorCodes, create_error_response_for_exception
 from ._protocol_types import (
     InitializeResult,
     ServerCapabilities,
     ServerInfo,
-    ToolCallResult,
-    ToolsListResult,
 )
-from ._tool_schemas import (
-    get_all_tool_definitions,
-    get_tool_schema,
-    validate_tool_exists,
-)
-from ._validators import validate_with_json_schema
+from ._tool_schemas import TOOL_DEFINITIONS, validate_tool_exists
 from ._version import __version__
 from .protocol import (
     JsonRpcRequest,
     create_error_response,
     create_success_response,
+    create_success_response_from_json,
+    json_dumps,
 )
+from .tools import TOOL_VALIDATORS, list_tools_json
 
 logger = logging.getLogger(__name__)
 
+# ToolCallResult with a single text item, filled with the JSON-encoded text
+_TEXT_RESULT_TEMPLATE = '{"content":[{"type":"text","text":%s}]}'
+
+# Tools whose schema accepts an empty arguments object without validation
+_NO_REQUIRED_ARGUMENTS = frozenset(
+    name
+    for name, definition in TOOL_DEFINITIONS.items()
+    if not definition["inputSchema"].get("required")
+)
+
 
 class MCPHandler:
     """MCP protocol handler for processing MCP-specific requests."""
@@ -118,12 +124,9 @@ class MCPHandler:
 
         logger.debug("Handling tools/list request")
 
-        # Get all tool definitions
-        tool_definitions = get_all_tool_definitions()
-        result: ToolsListResult = {"tools": list(tool_definitions.values())}
-
-        logger.debug("Returning %s tools", len(result["tools"]))
-        return create_success_response(request.id, result)
+        logger.debug("Returning %s tools", len(TOOL_DEFINITIONS))
+        # The tool list is static, so splice in its cached serialization
+        return create_success_response_from_json(request.id, list_tools_json())
 
     def handle_tools_call(self, request: JsonRpcRequest) -> str:
         """
@@ -154,7 +157,9 @@ class MCPHandler:
 
         # Extract tool call parameters
         tool_name = request.params.get("name")
-        arguments = request.params.get("arguments", {})
+        arguments = request.params.get("arguments")
+        if arguments is None:
+            arguments = {}
 
         if not tool_name:
             logger.warning("tools/call missing tool name")
@@ -171,8 +176,15 @@ class MCPHandler:
                 request.id, ErrorCodes.INVALID_PARAMS, f"Unknown tool: {tool_name}"
             )
 
-        # Execute the tool using centralized error handling
-        return safe_execute(request.id, self._execute_tool, tool_name, arguments)
+        try:
+            text = self._execute_tool(tool_name, arguments)
+        except Exception as e:  # pylint: disable=broad-except
+            return create_error_response_for_exception(request.id, e)
+
+        # Serialize straight into the result envelope without building dicts
+        return create_success_response_from_json(
+            request.id, _TEXT_RESULT_TEMPLATE % json_dumps(text)
+        )
 
     def handle_ping(self, _request: JsonRpcRequest) -> None:
         """
@@ -186,9 +198,7 @@ class MCPHandler:
         """
         logger.debug("Received ping notification")
 
-    def _execute_tool(
-        self, tool_name: str, arguments: Dict[str, Any]
-    ) -> ToolCallResult:
+    def _execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> str:
         """
         Execute a specific tool with given arguments.
 
@@ -197,25 +207,22 @@ class MCPHandler:
             arguments: Arguments for the tool.
 
         Returns:
-            ToolCallResult containing the execution result.
+            Text content of the tool result.
 
         Raises:
             ValidationException: If parameters are invalid.
             ClipboardError: If clipboard operation fails.
         """
-        # Validate arguments against tool schema
-        schema = get_tool_schema(tool_name)
-        validate_with_json_schema(arguments, dict(schema))
-
-        if tool_name == "get_clipboard":
-            return execute_get_clipboard()
-
-        if tool_name == "set_clipboard":
-            text = arguments["text"]
-            return execute_set_clipboard(text)
-
-        # This should not happen if validate_tool_exists was called
-        raise ValueError(f"Unknown tool: {tool_name}")
+        # Validate arguments against the precompiled tool schema; an empty
+        # object is always valid for tools without required arguments
+        trivially_valid = (
+            isinstance(arguments, dict)
+            and not arguments
+            and tool_name in _NO_REQUIRED_ARGUMENTS
+        )
+        if not trivially_valid:
+            TOOL_VALIDATORS[tool_name](arguments)
+        return TOOL_EXECUTORS[tool_name](arguments)
 
     def handle_request(self, request: JsonRpcRequest) -> Optional[str]:
         """
@@ -230,8 +237,8 @@ class MCPHandler:
         method = request.method
 
         # Check if we have a handler for this method
-        if method in self.method_handlers:
-            handler = self.method_handlers[method]
+        handler = self.method_handlers.get(method)
+        if handler is not None:
             return handler(request)
 
         # Unknown method
@@ -1,6 +1,7 @@
 """JSON Schema definitions for MCP tool input parameters."""
 
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping
 
 from ._protocol_types import ToolDefinition, ToolInputSchema
 
@@ -26,19 +27,21 @@ SET_CLIPBOARD_SCHEMA: ToolInputSchema = {
     "additionalProperties": False,
 }
 
-# Complete tool definitions with schemas
-TOOL_DEFINITIONS: Dict[str, ToolDefinition] = {
-    "get_clipboard": {
-        "name": "get_clipboard",
-        "description": "Get the current text content from the system clipboard",
-        "inputSchema": GET_CLIPBOARD_SCHEMA,
-    },
-    "set_clipboard": {
-        "name": "set_clipboard",
-        "description": "Set the system clipboard to the provided text content",
-        "inputSchema": SET_CLIPBOARD_SCHEMA,
-    },
-}
+# Complete tool definitions with schemas, read-only since they never change
+TOOL_DEFINITIONS: Mapping[str, ToolDefinition] = MappingProxyType(
+    {
+        "get_clipboard": {
+            "name": "get_clipboard",
+            "description": "Get the current text content from the system clipboard",
+            "inputSchema": GET_CLIPBOARD_SCHEMA,
+        },
+        "set_clipboard": {
+            "name": "set_clipboard",
+            "description": "Set the system clipboard to the provided text content",
+            "inputSchema": SET_CLIPBOARD_SCHEMA,
+        },
+    }
+)
 
 
 def get_tool_schema(tool_name: str) -> ToolInputSchema:
@@ -67,7 +70,7 @@ def get_all_tool_definitions() -> Dict[str, ToolDefinition]:
     Returns:
         Dict mapping tool names to their definitions.
     """
-    return TOOL_DEFINITIONS.copy()
+    return dict(TOOL_DEFINITIONS)
 
 
 def validate_tool_exists(tool_name: str) -> bool:
@@ -1,8 +1,9 @@
 """Input validation utilities for MCP clipboard server."""
 
 import json
+import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 try:
     import jsonschema
@@ -12,6 +13,23 @@ except ImportError:
     HAS_JSONSCHEMA = False
 
 
+# A precompiled validator: raises ValidationException for invalid data
+SchemaValidator = Callable[[Any], None]
+
+# Schema errors echo the offending value, which may be a 1MB clipboard payload
+_MAX_SCHEMA_MESSAGE_LENGTH = 200
+
+# Lone surrogates are valid in a Python str but cannot be encoded as UTF-8
+_SURROGATE_RE = re.compile("[\ud800-\udfff]")
+
+
+def _schema_error_message(message: str, keyword: Any) -> str:
+    """Replace overly long schema error messages with a short summary."""
+    if len(message) <= _MAX_SCHEMA_MESSAGE_LENGTH:
+        return message
+    return f"Value failed '{keyword}' validation"
+
+
 @dataclass
 class ValidationError:
     """Represents a validation error with context."""
@@ -44,8 +62,19 @@ def validate_text_size(text: str, max_bytes: int = 1048576) -> None:
     if not isinstance(text, str):
         raise ValidationException([ValidationError("text", "Must be a string")])
 
-    byte_size = len(text.encode("utf-8"))
-    if byte_size > max_bytes:
+    if not text.isascii() and _SURROGATE_RE.search(text):
+        raise ValidationException(
+            [ValidationError("text", "Text contains unpaired surrogates")]
+        )
+
+    # UTF-8 uses 1-4 bytes per character (exactly 1 for ASCII), so only make
+    # an encoded copy of the text when its length alone is ambiguous
+    char_count = len(text)
+    if char_count * 4 <= max_bytes:
+        return
+    if char_count > max_bytes or (
+        not text.isascii() and len(text.encode("utf-8")) > max_bytes
+    ):
         raise ValidationException(
             [ValidationError("text", "Text exceeds 1MB limit", limit=max_bytes)]
         )
@@ -114,36 +143,109 @@ def validate_json_rpc_structure(data: Dict[str, Any]) -> None:
         raise ValidationException(errors)
 
 
-def validate_with_json_schema(data: Any, schema: Dict[str, Any]) -> None:
+def compile_json_schema(schema: Dict[str, Any]) -> SchemaValidator:
     """
-    Validate data against a JSON schema.
+    Build a reusable validator for a JSON schema.
+
+    The schema is checked and the validator class resolved once here, so
+    repeated validation against the same schema skips that work.
 
     Args:
-        data: Data to validate
         schema: JSON schema to validate against
 
+    Returns:
+        Callable that validates data and raises ValidationException on failure
+
     Raises:
-        ValidationException: If validation fails
+        ValidationException: If the schema itself is invalid
     """
     if not HAS_JSONSCHEMA:
-        # Fallback to basic validation for required fields
-        if schema.get("type") == "object":
-            required = schema.get("required", [])
+        # Fallback to basic validation of required, extra and string properties
+        required = schema.get("required", [])
+        is_object = schema.get("type") == "object"
+        properties = schema.get("properties", {})
+        string_limits = {
+            name: prop.get("maxLength")
+            for name, prop in properties.items()
+            if prop.get("type") == "string"
+        }
+        allowed = (
+            frozenset(properties)
+            if schema.get("additionalProperties") is False
+            else None
+        )
+
+        def validate_basic(data: Any) -> None:
+            if not is_object:
+                return
             validate_json_structure(data, required)
-        return
+            if allowed is not None and not allowed.issuperset(data):
+                raise ValidationException(
+                    [
+                        ValidationError(name, "Unexpected property")
+                        for name in sorted(set(data) - allowed)
+                    ]
+                )
+            for name, max_length in string_limits.items():
+                if name in data:
+                    _validate_string_property(name, data[name], max_length)
+
+        return validate_basic
 
+    validator_class = jsonschema.validators.validator_for(schema)
     try:
-        jsonschema.validate(data, schema)
-    except jsonschema.ValidationError as e:
-        # Convert jsonschema error to our format
-        field_path = ".".join(str(p) for p in e.path) if e.path else "root"
-        error = ValidationError(field_path, e.message)
-        raise ValidationException([error]) from e
+        validator_class.check_schema(schema)
     except jsonschema.SchemaError as e:
         # Schema itself is invalid
         raise ValidationException(
             [ValidationError("schema", f"Invalid schema: {e.message}")]
         ) from e
+    validator = validator_class(schema)
+
+    def validate_compiled(data: Any) -> None:
+        try:
+            validator.validate(data)
+        except jsonschema.ValidationError as e:
+            # Convert jsonschema error to our format
+            field_path = ".".join(str(p) for p in e.path) if e.path else "root"
+            message = _schema_error_message(e.message, e.validator)
+            # Unchained: the backend error would echo the full payload in tracebacks
+            raise ValidationException([ValidationError(field_path, message)]) from None
+
+    return validate_compiled
+
+
+def _validate_string_property(
+    name: str, value: Any, max_length: Optional[int]
+) -> None:
+    """Check a string property's type and maxLength for the basic fallback."""
+    if not isinstance(value, str):
+        raise ValidationException([ValidationError(name, "Must be a string")])
+    if max_length is not None and len(value) > max_length:
+        raise ValidationException(
+            [
+                ValidationError(
+                    name, f"Longer than {max_length} characters", limit=max_length
+                )
+            ]
+        )
+
+
+def validate_with_json_schema(data: Any, schema: Dict[str, Any]) -> None:
+    """
+    Validate data against a JSON schema.
+
+    Prefer compile_json_schema() when validating against the same schema
+    repeatedly.
+
+    Args:
+        data: Data to validate
+        schema: JSON schema to validate against
+
+    Raises:
+        ValidationException: If validation fails
+    """
+    compile_json_schema(schema)(data)
 
 
 def validate_clipboard_text(text: str) -> None:
@@ -56,8 +56,9 @@ Examples:
   python -m mcp_clipboard_server          # Alternative startup method
 
 Environment Variables:
-  MCP_LOG_LEVEL    Set logging level (DEBUG, INFO, WARNING, ERROR)
-  MCP_LOG_JSON     Use JSON logging format (true/false)
+  MCP_LOG_LEVEL      Set logging level (DEBUG, INFO, WARNING, ERROR)
+  MCP_LOG_JSON       Use JSON logging format (true/false)
+  MCP_TERSE_REPLIES  Reply "ok" to set_clipboard instead of a summary (true/false)
         """,
     )
 
@@ -1,5 +1,6 @@
 """Cross-platform clipboard access module with platform-specific fallback handling."""
 
+import functools
 import logging
 import os
 import platform
@@ -15,21 +16,32 @@ from ._validators import ValidationException, validate_clipboard_text
 logger = logging.getLogger(__name__)
 
 
+def _read_proc_version() -> str:
+    """Return the kernel version string, or "" where /proc/version is absent."""
+    if not os.path.exists("/proc/version"):
+        return ""
+    try:
+        with open("/proc/version", "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except (IOError, OSError):
+        return ""
+
+
+@functools.lru_cache(maxsize=1)
 def _get_platform_info() -> str:
-    """Get detailed platform information for error messages."""
+    """Get detailed platform information for error messages.
+
+    The result is cached for the life of the process since the platform,
+    WSL kernel and display environment do not change under a running server.
+    """
     system = platform.system()
 
     # Handle Linux variants
     if system == "Linux":
         # Check for WSL first
-        if os.path.exists("/proc/version"):
-            try:
-                with open("/proc/version", "r", encoding="utf-8") as f:
-                    version = f.read().strip()
-                    if "Microsoft" in version or "WSL" in version:
-                        return "WSL (Windows Subsystem for Linux)"
-            except (IOError, OSError):
-                pass
+        version = _read_proc_version()
+        if "Microsoft" in version or "WSL" in version:
+            return "WSL (Windows Subsystem for Linux)"
 
         # Check for Wayland environment
         if "WAYLAND_DISPLAY" in os.environ:
@@ -47,6 +59,11 @@ def _get_platform_info() -> str:
     return platform_map.get(system, f"{system} (unsupported)")
 
 
+def _invalidate_platform_cache() -> None:
+    """Forget the cached platform description so it is recomputed."""
+    _get_platform_info.cache_clear()
+
+
 def _get_platform_guidance(error_msg: str) -> str:
     """Get platform-specific guidance for clipboard errors."""
     platform_info = _get_platform_info()
@@ -1,8 +1,83 @@
 """JSON-RPC 2.0 protocol handling for MCP communication with batch request support."""
 
 import json
+import sys
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Success envelope with the id and result slots filled by pre-serialized JSON.
+# Output is compact with or without orjson, so the wire format is the same.
+_SUCCESS_TEMPLATE = '{"jsonrpc":"2.0","id":%s,"result":%s}'
+_ERROR_TEMPLATE = '{"jsonrpc":"2.0","id":%s,"error":%s}'
+_SEPARATORS = (",", ":")
+
+
+def json_dumps(obj: Any) -> str:
+    """
+    Serialize a result value to JSON, using orjson when it is installed.
+
+    Args:
+        obj: Value to serialize.
+
+    Returns:
+        str: JSON-encoded value.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            # e.g. integers beyond 64 bits, which the stdlib encoder handles
+            pass
+    return json.dumps(obj, separators=_SEPARATORS)
+
+
+def json_loads(data: str) -> Any:
+    """
+    Deserialize a JSON document, using orjson when it is installed.
+
+    Args:
+        data: JSON text to decode.
+
+    Returns:
+        Any: The decoded value.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the stdlib (e.g. NaN, lone surrogates),
+            # so let the stdlib have the final say
+            pass
+    return json.loads(data)
+
+
+def _encode_null_id(_request_id: None) -> str:
+    """Encode a null request ID."""
+    return "null"
+
+
+# Request IDs are almost always int, str or None, so encode them with a
+# single lookup by exact type; anything else falls back to json.dumps
+_ID_ENCODERS: Dict[type, Callable[[Any], str]] = {
+    int: int.__repr__,
+    str: json.dumps,
+    type(None): _encode_null_id,
+}
+
+
+def _encode_id(request_id: Any) -> str:
+    """Encode a request ID as a JSON fragment."""
+    return _ID_ENCODERS.get(type(request_id), json.dumps)(request_id)
 
 
 @dataclass
@@ -17,9 +92,14 @@ class JsonRpcRequest:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "JsonRpcRequest":
         """Create request from dictionary."""
+        method = data.get("method", "")
+        if type(method) is str:  # pylint: disable=unidiomatic-typecheck
+            # Interned methods match the dispatch table keys by identity
+            method = sys.intern(method)
+
         return cls(
             jsonrpc=data.get("jsonrpc", ""),
-            method=data.get("method", ""),
+            method=method,
             id=data.get("id"),
             params=data.get("params"),
         )
@@ -60,13 +140,32 @@ class JsonRpcResponse:
         return response
 
 
-def _validate_json_rpc_object(obj: dict) -> None:
-    """Validate a single JSON-RPC object."""
+def _has_float_id(parsed: Any) -> bool:
+    """Check whether any request ID in a decoded message is a float."""
+    if isinstance(parsed, dict):
+        return type(parsed.get("id")) is float
+    if isinstance(parsed, list):
+        return any(
+            isinstance(item, dict) and type(item.get("id")) is float
+            for item in parsed
+        )
+    return False
+
+
+def _request_from_object(obj: dict) -> JsonRpcRequest:
+    """Validate a single JSON-RPC object and build its request in one pass."""
     if obj.get("jsonrpc") != "2.0":
         raise ValueError("Invalid request: jsonrpc must be '2.0'")
 
-    if "method" not in obj:
-        raise ValueError("Invalid request: missing method")
+    try:
+        method = obj["method"]
+    except KeyError:
+        raise ValueError("Invalid request: missing method") from None
+
+    if type(method) is str:  # pylint: disable=unidiomatic-typecheck
+        method = sys.intern(method)
+
+    return JsonRpcRequest("2.0", method, obj.get("id"), obj.get("params"))
 
 
 def _parse_batch_request(parsed: list) -> List[JsonRpcRequest]:
@@ -79,16 +178,14 @@ def _parse_batch_request(parsed: list) -> List[JsonRpcRequest]:
         if not isinstance(item, dict):
             raise ValueError("Invalid request: batch items must be JSON objects")
 
-        _validate_json_rpc_object(item)
-        requests.append(JsonRpcRequest.from_dict(item))
+        requests.append(_request_from_object(item))
 
     return requests
 
 
 def _parse_single_request(parsed: dict) -> JsonRpcRequest:
     """Parse a single JSON-RPC request."""
-    _validate_json_rpc_object(parsed)
-    return JsonRpcRequest.from_dict(parsed)
+    return _request_from_object(parsed)
 
 
 def parse_json_rpc_message(data: str) -> Union[JsonRpcRequest, List[JsonRpcRequest]]:
@@ -105,10 +202,15 @@ def parse_json_rpc_message(data: str) -> Union[JsonRpcRequest, List[JsonRpcReque
         ValueError: If JSON is malformed or missing required fields.
     """
     try:
-        parsed = json.loads(data)
+        parsed = json_loads(data)
     except json.JSONDecodeError as e:
         raise ValueError(f"Parse error: {str(e)}") from e
 
+    if HAS_ORJSON and _has_float_id(parsed):
+        # orjson silently turns integers beyond 64 bits into floats, which
+        # would no longer echo back as the client's ID
+        parsed = json.loads(data)
+
     # Check if it's a batch request (array)
     if isinstance(parsed, list):
         return _parse_batch_request(parsed)
@@ -131,8 +233,23 @@ def create_success_response(request_id: Optional[Union[str, int]], result: Any)
     Returns:
         str: JSON-encoded response.
     """
-    response = JsonRpcResponse(jsonrpc="2.0", id=request_id, result=result)
-    return json.dumps(response.to_dict())
+    return _SUCCESS_TEMPLATE % (_encode_id(request_id), json_dumps(result))
+
+
+def create_success_response_from_json(
+    request_id: Optional[Union[str, int]], result_json: str
+) -> str:
+    """
+    Create a successful JSON-RPC response around an already-serialized result.
+
+    Args:
+        request_id: The ID from the original request.
+        result_json: JSON-encoded result data.
+
+    Returns:
+        str: JSON-encoded response.
+    """
+    return _SUCCESS_TEMPLATE % (_encode_id(request_id), result_json)
 
 
 def create_error_response(
@@ -150,9 +267,10 @@ def create_error_response(
     Returns:
         str: JSON-encoded error response.
     """
-    error = JsonRpcError(code=code, message=message, data=data)
-    response = JsonRpcResponse(jsonrpc="2.0", id=request_id, error=error)
-    return json.dumps(response.to_dict())
+    error: Dict[str, Any] = {"code": code, "message": message}
+    if data is not None:
+        error["data"] = data
+    return _ERROR_TEMPLATE % (_encode_id(request_id), json_dumps(error))
 
 
 def create_batch_response(responses: List[Optional[str]]) -> str:
@@ -172,9 +290,6 @@ def create_batch_response(responses: List[Optional[str]]) -> str:
     if not valid_responses:
         return ""
 
-    # Parse each response and collect into array
-    response_objects = []
-    for resp in valid_responses:
-        response_objects.append(json.loads(resp))
-
-    return json.dumps(response_objects)
+    # Each response is already a complete JSON object, so splice rather than
+    # decoding and re-encoding every one of them
+    return "[" + ",".join(valid_responses) + "]"
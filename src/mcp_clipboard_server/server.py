@@ -1,6 +1,8 @@
 """Main MCP server implementation."""
 
 import logging
+import os
+import queue
 import sys
 import threading
 from typing import List, Optional
@@ -15,9 +17,22 @@ from .protocol import (
     create_error_response,
     parse_json_rpc_message,
 )
+from .tools import refresh_log_flags
 
 logger = logging.getLogger(__name__)
 
+# Method prefixes that are only ever sent as fire-and-forget notifications
+_NOTIFICATION_PREFIXES = ("$/", "notifications/")
+
+# Raw stdout file descriptor for responses, or None to go through sys.stdout
+_stdout_fd: Optional[int] = None
+
+# How often the main loop wakes up to check for a shutdown request (seconds)
+_SHUTDOWN_POLL_INTERVAL = 0.1
+
+# Maximum number of read-ahead messages before the stdin reader blocks
+_MAX_PENDING_MESSAGES = 64
+
 
 class MCPServer:
     """MCP clipboard server implementation."""
@@ -74,6 +89,18 @@ class MCPServer:
         Returns:
             JSON response string, or None for notifications.
         """
+        # Notifications never get a response, so skip request/response logging
+        if (
+            request.id is None
+            and isinstance(request.method, str)
+            and request.method.startswith(_NOTIFICATION_PREFIXES)
+        ):
+            try:
+                self.mcp_handler.handle_request(request)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Notification handler failed: %s", request.method)
+            return None
+
         # Log the incoming request
         log_request(
             logger,
@@ -135,10 +162,8 @@ class MCPServer:
         return create_batch_response(responses)
 
 
-def _read_stdin_line(
-    _shutdown_event: Optional[threading.Event] = None,
-) -> Optional[str]:
-    """Read a line from stdin with shutdown checking."""
+def _read_stdin_line() -> Optional[str]:
+    """Read a line from stdin, returning None on EOF or interrupt."""
     try:
         line = sys.stdin.readline()
         if not line:  # EOF
@@ -157,20 +182,64 @@ def _read_stdin_line(
         return None
 
 
+def _stdin_reader(messages: "queue.Queue[Optional[str]]") -> None:
+    """Read stdin lines into the message queue, ending with None on EOF."""
+    try:
+        while True:
+            line = _read_stdin_line()
+            if line is None:
+                break
+            if line:
+                messages.put(line)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.error("Error reading from stdin: %s", e, exc_info=True)
+    finally:
+        messages.put(None)
+
+
+def _configure_stdout() -> None:
+    """Write responses straight to the stdout fd unless stdout is a TTY."""
+    global _stdout_fd  # pylint: disable=global-statement
+    try:
+        if sys.stdout.isatty():
+            _stdout_fd = None
+            return
+        sys.stdout.flush()
+        _stdout_fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        # Replaced or captured stdout without a real file descriptor
+        _stdout_fd = None
+
+
+def _write_line(message: str) -> None:
+    """Write a newline-terminated message to stdout."""
+    if _stdout_fd is None:
+        sys.stdout.write(message + "\n")
+        sys.stdout.flush()  # Critical for STDIO communication
+        return
+
+    data = message.encode("utf-8") + b"\n"
+
+    # os.write is unbuffered, but may accept fewer bytes than requested
+    total = len(data)
+    with memoryview(data) as view:
+        offset = 0
+        while offset < total:
+            offset += os.write(_stdout_fd, view[offset:])
+
+
 def _send_response(response: Optional[str]) -> None:
     """Send response to stdout with error handling."""
     if response is not None:
         logger.debug("Sending: %s", response)
-        sys.stdout.write(response + "\n")
-        sys.stdout.flush()  # Critical for STDIO communication
+        _write_line(response)
 
 
 def _send_error_response(error_code: int, message: str) -> None:
     """Send error response with exception handling."""
     try:
         error_response = create_error_response(None, error_code, message)
-        sys.stdout.write(error_response + "\n")
-        sys.stdout.flush()
+        _write_line(error_response)
     except Exception as write_error:  # pylint: disable=broad-exception-caught
         logger.error("Failed to send error response: %s", write_error)
 
@@ -212,10 +281,20 @@ def run_server(shutdown_event: Optional[threading.Event] = None):
     """
     # Setup logging first
     setup_logging()
+    refresh_log_flags()
+    _configure_stdout()
 
     server = MCPServer()
     logger.info("Starting MCP clipboard server")
 
+    # Blocking stdin reads happen on a daemon thread so the loop below can
+    # notice a shutdown request without waiting for the next message
+    messages: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=_MAX_PENDING_MESSAGES)
+    reader = threading.Thread(
+        target=_stdin_reader, args=(messages,), name="mcp-stdin-reader", daemon=True
+    )
+    reader.start()
+
     try:
         while True:
             # Check shutdown signal
@@ -223,12 +302,13 @@ def run_server(shutdown_event: Optional[threading.Event] = None):
                 logger.info("Shutdown requested, exiting gracefully")
                 break
 
-            # Read line from stdin
-            line = _read_stdin_line(shutdown_event)
+            # Wait for the next line from the reader thread
+            try:
+                line = messages.get(timeout=_SHUTDOWN_POLL_INTERVAL)
+            except queue.Empty:
+                continue
             if line is None:  # EOF or interrupt
                 break
-            if line == "":  # Empty line
-                continue
 
             # Process the request
             _process_request(server, line)
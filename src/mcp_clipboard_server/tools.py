@@ -1,34 +1,90 @@
 """MCP tool implementations for clipboard operations."""
 
 import logging
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 
-from ._clipboard_utils import execute_get_clipboard, execute_set_clipboard
+from ._clipboard_utils import TOOL_EXECUTORS
+from ._clipboard_utils import refresh_log_flags as _refresh_clipboard_log_flags
 from ._errors import ErrorCodes
-from ._protocol_types import ToolCallResult
-from ._tool_schemas import (
-    get_all_tool_definitions,
-    get_tool_schema,
-    validate_tool_exists,
-)
+from ._protocol_types import ToolCallResult, ToolDefinition
+from ._tool_schemas import TOOL_DEFINITIONS
+from ._validators import SchemaValidator, ValidationException, compile_json_schema
 from .clipboard import ClipboardError
+from .protocol import json_dumps
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Log level checks cached for the per-call paths; see refresh_log_flags()
+_INFO = logger.isEnabledFor(logging.INFO)
+
+# Tool definitions never change at runtime, so the tools/list result is built
+# and serialized once; it is read-only so callers cannot change it for others
+_TOOLS_LIST_RESULT: Mapping[str, Tuple[ToolDefinition, ...]] = MappingProxyType(
+    {"tools": tuple(TOOL_DEFINITIONS.values())}
+)
+_TOOLS_LIST_JSON = json_dumps(dict(_TOOLS_LIST_RESULT))
+
+
+def refresh_log_flags() -> None:
+    """
+    Re-read the cached log level flags used on the tool execution path.
+
+    Call this after changing logging configuration at runtime.
+    """
+    global _INFO  # pylint: disable=global-statement
+    _INFO = logger.isEnabledFor(logging.INFO)
+    _refresh_clipboard_log_flags()
+
 
-def list_tools() -> Dict[str, Any]:
+def list_tools() -> Mapping[str, Tuple[ToolDefinition, ...]]:
     """
     Return the list of available tools for MCP tools/list request.
 
+    The same read-only result is returned on every call.
+
+    Returns:
+        Read-only mapping containing the tools tuple.
+    """
+    return _TOOLS_LIST_RESULT
+
+
+def list_tools_json() -> str:
+    """
+    Return the tools/list result pre-serialized as JSON.
+
     Returns:
-        Dict containing the tools array.
+        JSON-encoded string of the list_tools() result.
     """
-    tool_definitions = get_all_tool_definitions()
-    return {"tools": list(tool_definitions.values())}
+    return _TOOLS_LIST_JSON
+
 
+# Argument validators compiled once per tool rather than on every call
+TOOL_VALIDATORS: Dict[str, SchemaValidator] = {
+    name: compile_json_schema(dict(definition["inputSchema"]))
+    for name, definition in TOOL_DEFINITIONS.items()
+}
 
-def validate_tool_params(tool_name: str, params: Dict[str, Any]) -> None:
+_ToolExecutor = Callable[[Dict[str, Any]], str]
+
+# Validator and executor per tool, fetched together with a single lookup
+_TOOL_ENTRIES: Dict[str, Tuple[SchemaValidator, _ToolExecutor]] = {
+    name: (TOOL_VALIDATORS[name], TOOL_EXECUTORS[name]) for name in TOOL_VALIDATORS
+}
+
+
+def _check_params(
+    tool_name: str, validator: SchemaValidator, params: Optional[Dict[str, Any]]
+) -> None:
+    """Run a tool's compiled validator, treating missing params as empty."""
+    try:
+        validator({} if params is None else params)
+    except ValidationException as e:
+        raise ValueError(f"Invalid parameters for {tool_name}: {e}") from e
+
+
+def validate_tool_params(tool_name: str, params: Optional[Dict[str, Any]]) -> None:
     """
     Validate parameters for a tool call.
 
@@ -39,29 +95,10 @@ def validate_tool_params(tool_name: str, params: Dict[str, Any]) -> None:
     Raises:
         ValueError: If parameters are invalid.
     """
-    if not validate_tool_exists(tool_name):
+    validator = TOOL_VALIDATORS.get(tool_name)
+    if validator is None:
         raise ValueError(f"Unknown tool: {tool_name}")
-
-    _ = get_tool_schema(tool_name)
-
-    if tool_name == "get_clipboard":
-        # No parameters required
-        if params and len(params) > 0:
-            raise ValueError("get_clipboard does not accept parameters")
-
-    elif tool_name == "set_clipboard":
-        # Text parameter required
-        if not params or "text" not in params:
-            raise ValueError("set_clipboard requires 'text' parameter")
-
-        text = params["text"]
-        if not isinstance(text, str):
-            raise ValueError("'text' parameter must be a string")
-
-        # Additional parameters not allowed
-        if len(params) > 1:
-            extra_params = set(params.keys()) - {"text"}
-            raise ValueError(f"Unexpected parameters: {list(extra_params)}")
+    _check_params(tool_name, validator, params)
 
 
 def execute_tool(tool_name: str, params: Dict[str, Any]) -> ToolCallResult:
@@ -76,34 +113,41 @@ def execute_tool(tool_name: str, params: Dict[str, Any]) -> ToolCallResult:
         ToolCallResult containing the tool execution result.
 
     Raises:
-        ValueError: If tool name is invalid or parameters are wrong.
+        ValueError: If tool name is invalid, parameters are wrong, or the
+            clipboard layer rejects the input.
         RuntimeError: If tool execution fails.
     """
-    logger.info("Executing tool: %s", tool_name)
+    if _INFO:
+        logger.info("Executing tool: %s", tool_name)
+
+    entry = _TOOL_ENTRIES.get(tool_name)
+    if entry is None:
+        raise ValueError(f"Unknown tool: {tool_name}")
+    validator, executor = entry
 
     # Validate parameters first
-    validate_tool_params(tool_name, params)
+    _check_params(tool_name, validator, params)
 
     try:
-        if tool_name == "get_clipboard":
-            return execute_get_clipboard()
-
-        if tool_name == "set_clipboard":
-            text = params["text"]
-            return execute_set_clipboard(text)
-
+        text = executor(params)
     except ClipboardError as e:
         logger.error("Clipboard operation failed: %s", e)
-        raise RuntimeError(f"Clipboard operation failed: {str(e)}") from e
-    except ValueError as e:
-        logger.error("Invalid clipboard operation: %s", e)
-        raise RuntimeError(f"Invalid operation: {str(e)}") from e
+        raise RuntimeError(f"Clipboard operation failed: {e}") from e
+    except ValueError:
+        # Rejected input (e.g. oversized text) stays an invalid-params error
+        raise
     except Exception as e:
-        logger.error("Unexpected error in tool execution: %s", e)
-        raise RuntimeError(f"Tool execution failed: {str(e)}") from e
+        logger.exception("Tool execution failed: %s", tool_name)
+        raise RuntimeError(f"Tool execution failed: {e}") from e
+
+    return {"content": [{"type": "text", "text": text}]}
+
 
-    # This should never be reached
-    raise ValueError(f"Unknown tool: {tool_name}")
+# Exact exception types raised by execute_tool, mapped without an MRO walk
+_TOOL_ERROR_CODES: Dict[type, int] = {
+    ValueError: ErrorCodes.INVALID_PARAMS,
+    RuntimeError: ErrorCodes.SERVER_ERROR,
+}
 
 
 def get_tool_error_code(error: Exception) -> int:
@@ -116,6 +160,10 @@ def get_tool_error_code(error: Exception) -> int:
     Returns:
         Appropriate JSON-RPC error code.
     """
+    code = _TOOL_ERROR_CODES.get(type(error))
+    if code is not None:
+        return code
+    # Subclasses fall back to an isinstance check
     if isinstance(error, ValueError):
         return ErrorCodes.INVALID_PARAMS
     return ErrorCodes.SERVER_ERROR
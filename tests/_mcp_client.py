@@ -0,0 +1,239 @@
+"""Subprocess client shared by the MCP server integration and e2e tests."""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from json.encoder import encode_basestring_ascii
+from typing import IO, Any, Dict, List, Optional, Set
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def encode_line(message: Any) -> bytes:
+    """Serialize a JSON-RPC message as a newline-terminated UTF-8 line."""
+    if orjson is not None:
+        # orjson appends the newline itself, so the payload is never copied
+        return orjson.dumps(message, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(message) + "\n").encode()
+
+
+def decode_line(line: bytes) -> Any:
+    """Parse a JSON-RPC message line from the server."""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+# Command line for every server subprocess, built once
+SERVER_ARGV = (sys.executable, "-m", "mcp_clipboard_server")
+
+# Slice size used when streaming large request payloads
+LARGE_WRITE_CHUNK = 64 * 1024
+
+# Every server subprocess the tests launch, until it is stopped; the
+# teardown_checks fixture kills anything still in here at session end
+LIVE_SERVER_PROCESSES: Set[subprocess.Popen] = set()
+
+READINESS_PROBE = {"jsonrpc": "2.0", "id": "readiness-probe", "method": "tools/list"}
+INITIALIZE_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": "initialize",
+    "method": "initialize",
+    "params": {"protocolVersion": "2024-11-05"},
+}
+TOOLS_LIST_REQUEST = {"jsonrpc": "2.0", "id": "tools-list", "method": "tools/list"}
+
+
+class MCPIntegrationTest:
+    """Integration test helper for MCP server."""
+
+    def __init__(self):
+        """Initialize integration test."""
+        self.process: Optional[subprocess.Popen] = None
+        self.stderr_file: Optional[IO[str]] = None
+        # Static handshake metadata, fetched once per server process
+        self.server_info: Optional[Dict[str, Any]] = None
+        self.capabilities: Optional[Dict[str, Any]] = None
+        self.tools: Optional[Dict[str, Dict[str, Any]]] = None
+        self._stdin_fd: Optional[int] = None
+
+    def start_server(self):
+        """Start the MCP server as a subprocess."""
+        self.server_info = self.capabilities = self.tools = None
+        # Logs go to a file so an undrained stderr pipe can never block the server
+        self.stderr_file = tempfile.TemporaryFile(mode="w+")
+        self.process = subprocess.Popen(
+            SERVER_ARGV,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self.stderr_file,
+        )
+        LIVE_SERVER_PROCESSES.add(self.process)
+        # Requests bypass the buffered writer and go straight to the pipe
+        self._stdin_fd = self.process.stdin.fileno()
+
+        # Wait for the server to answer; tools/list leaves it uninitialized
+        try:
+            self.send_request(READINESS_PROBE)
+        except (RuntimeError, ValueError) as e:
+            raise RuntimeError(
+                f"Server failed to start: {e}\n{self.read_stderr()}"
+            ) from e
+
+    def ensure_initialized(self) -> None:
+        """
+        Initialize the server and cache its handshake metadata.
+
+        The first call after a (re)start sends initialize and tools/list in
+        one batch and fills ``server_info``, ``capabilities`` and ``tools``;
+        later calls do nothing.
+        """
+        if self.server_info is not None:
+            return
+        responses = self.send_batch([INITIALIZE_REQUEST, TOOLS_LIST_REQUEST])
+        init_result = responses[INITIALIZE_REQUEST["id"]]["result"]
+        tools = responses[TOOLS_LIST_REQUEST["id"]]["result"]["tools"]
+        self.capabilities = init_result["capabilities"]
+        self.tools = {tool["name"]: tool for tool in tools}
+        self.server_info = init_result["serverInfo"]
+
+    def read_stderr(self) -> str:
+        """Return everything the server has logged so far."""
+        if self.stderr_file is None:
+            return ""
+        self.stderr_file.seek(0)
+        return self.stderr_file.read()
+
+    def stop_server(self):
+        """Stop the MCP server."""
+        if self.process:
+            # Closing stdin is a clean shutdown: the server exits on EOF
+            self.process.stdin.close()
+            try:
+                self.process.wait(timeout=0.5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait(timeout=0.5)
+            LIVE_SERVER_PROCESSES.discard(self.process)
+        if self.stderr_file is not None:
+            self.stderr_file.close()
+            self.stderr_file = None
+
+    def send_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a JSON-RPC request and get the response.
+
+        Args:
+            request: JSON-RPC request dictionary.
+
+        Returns:
+            JSON-RPC response dictionary.
+        """
+        if not self.process:
+            raise RuntimeError("Server not started")
+
+        self.send_raw(encode_line(request))
+        return self.read_response()
+
+    def read_response(self) -> Any:
+        """
+        Read the next JSON-RPC response line from the server.
+
+        Returns:
+            Parsed response: a dictionary, or a list for batch replies.
+        """
+        response_line = self.process.stdout.readline()
+        if not response_line:
+            raise RuntimeError("No response from server")
+
+        return decode_line(response_line)
+
+    def read_responses(self, count: int) -> List[Dict[str, Any]]:
+        """
+        Read exactly ``count`` response lines in bulk.
+
+        Pulls whatever the pipe has with ``read1`` until enough newlines have
+        arrived, then splits in memory instead of calling readline per line.
+
+        Args:
+            count: Number of responses expected.
+
+        Returns:
+            Parsed responses in arrival order.
+        """
+        buffer = bytearray()
+        while buffer.count(b"\n") < count:
+            chunk = self.process.stdout.read1(65536)
+            if not chunk:
+                raise RuntimeError("No response from server")
+            buffer += chunk
+        lines = buffer.split(b"\n")
+        if len(lines) != count + 1 or lines[-1]:
+            raise RuntimeError(f"Expected {count} responses, got extra output")
+        return [decode_line(line) for line in lines[:-1]]
+
+    def send_raw(self, data: bytes) -> None:
+        """
+        Write pre-encoded, newline-terminated messages to the server.
+
+        Args:
+            data: Encoded message bytes.
+        """
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._stdin_fd, view) :]
+
+    def send_batch(self, requests: List[Dict[str, Any]]) -> Dict[Any, Dict[str, Any]]:
+        """
+        Send several JSON-RPC requests as one batch.
+
+        Args:
+            requests: JSON-RPC request dictionaries.
+
+        Returns:
+            Responses keyed by request ID, since batch order is not guaranteed.
+        """
+        if not self.process:
+            raise RuntimeError("Server not started")
+
+        self.send_raw(encode_line(requests))
+        return {response["id"]: response for response in self.read_response()}
+
+    def send_large_set(self, text: str, request_id: str) -> Dict[str, Any]:
+        """
+        Call set_clipboard without building the whole request in memory.
+
+        The text is escaped and written in slices between a fixed prefix and
+        suffix, so no serialized copy of the full payload is ever created.
+
+        Args:
+            text: Clipboard text to set.
+            request_id: Request ID.
+
+        Returns:
+            JSON-RPC response dictionary.
+        """
+        self.send_raw(
+            b'{"jsonrpc":"2.0","id":%s,"method":"tools/call",'
+            b'"params":{"name":"set_clipboard","arguments":{"text":"'
+            % json.dumps(request_id).encode()
+        )
+        for start in range(0, len(text), LARGE_WRITE_CHUNK):
+            chunk = text[start : start + LARGE_WRITE_CHUNK]
+            self.send_raw(encode_basestring_ascii(chunk)[1:-1].encode())
+        self.send_raw(b'"}}}\n')
+        return self.read_response()
+
+    def __enter__(self):
+        """Context manager entry."""
+        self.start_server()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.stop_server()
@@ -0,0 +1,52 @@
+"""Shared fixtures for the subprocess integration tests."""
+
+import pyperclip
+import pytest
+
+from ._mcp_client import LIVE_SERVER_PROCESSES, MCPIntegrationTest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def teardown_checks():
+    """Kill any server subprocess a failed test or fixture left running."""
+    yield
+    for process in list(LIVE_SERVER_PROCESSES):
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+    LIVE_SERVER_PROCESSES.clear()
+
+
+@pytest.fixture(scope="session")
+def session_mcp_server(teardown_checks):
+    """Start one MCP server subprocess for the whole test session."""
+    server = MCPIntegrationTest()
+    server.start_server()
+    server.ensure_initialized()
+    yield server
+    server.stop_server()
+
+
+@pytest.fixture
+def mcp_server(session_mcp_server):
+    """Provide the shared, initialized MCP server, restarting it if it died."""
+    if session_mcp_server.process.poll() is not None:
+        # Release the dead process's stderr file and registry entry first
+        session_mcp_server.stop_server()
+        session_mcp_server.start_server()
+    session_mcp_server.ensure_initialized()
+    return session_mcp_server
+
+
+@pytest.fixture
+def clipboard_backup():
+    """Snapshot the system clipboard and restore it after the test."""
+    try:
+        original = pyperclip.paste()
+    except Exception:  # pylint: disable=broad-except
+        original = ""
+    yield original
+    try:
+        pyperclip.copy(original)
+    except Exception:  # pylint: disable=broad-except
+        pass  # Best effort restore
@@ -57,6 +57,13 @@ class TestClipboard:
         with pytest.raises(ValueError, match="Text exceeds 1MB limit"):
             set_clipboard(large_text)
 
+    @patch("mcp_clipboard_server.clipboard.pyperclip.copy")
+    def test_set_clipboard_lone_surrogate(self, mock_copy):
+        """Test that text which cannot be encoded as UTF-8 is rejected."""
+        with pytest.raises(ValueError, match="unpaired surrogates"):
+            set_clipboard("abc\ud800")
+        mock_copy.assert_not_called()
+
     @patch("mcp_clipboard_server.clipboard.pyperclip.copy")
     def test_set_clipboard_unicode(self, mock_copy):
         """Test setting clipboard with Unicode content."""
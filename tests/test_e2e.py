@@ -1,66 +1,92 @@
 """End-to-end subprocess tests for MCP clipboard server."""
 
 import json
+import queue
 import subprocess
 import sys
-import time
-from typing import Any, Dict, Optional
+import tempfile
+import threading
+from typing import IO, Any, Dict, Optional
 
 import pyperclip
 import pytest
 
+from ._mcp_client import LIVE_SERVER_PROCESSES, SERVER_ARGV
+
+
+# Readiness check that also initializes the server, unlike the tools/list
+# READINESS_PROBE in _mcp_client, so tests may call tools straight away
+INITIALIZE_PROBE = {
+    "jsonrpc": "2.0",
+    "id": "initialize-probe",
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "test-client", "version": "1.0.0"},
+    },
+}
+
 
 class MCPServerProcess:
     """Helper class to manage MCP server subprocess."""
 
     def __init__(self):
         self.process: Optional[subprocess.Popen] = None
-        self.original_clipboard: str = ""
+        self.stderr_file: Optional[IO[str]] = None
+        self._lines: "queue.Queue[str]" = queue.Queue()
+        self._reader: Optional[threading.Thread] = None
 
     def start(self, timeout: float = 5.0) -> None:
         """Start the MCP server subprocess."""
-        # Save original clipboard content
-        try:
-            self.original_clipboard = pyperclip.paste() or ""
-        except Exception:
-            self.original_clipboard = ""
-
-        # Start the server process
-        cmd = [sys.executable, "-m", "mcp_clipboard_server"]
+        # Start the server process; logs go to a file so they never fill a pipe
+        self.stderr_file = tempfile.TemporaryFile(mode="w+")
         self.process = subprocess.Popen(
-            cmd,
+            SERVER_ARGV,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stderr=self.stderr_file,
             text=True,
             bufsize=0,  # Unbuffered
         )
+        LIVE_SERVER_PROCESSES.add(self.process)
+
+        # One reader per process: select() cannot see lines already buffered
+        # in the text wrapper, and only supports sockets on Windows
+        self._lines = queue.Queue()
+        self._reader = threading.Thread(
+            target=self._read_stdout,
+            args=(self.process.stdout, self._lines),
+            daemon=True,
+        )
+        self._reader.start()
 
-        # Give the process time to start
-        time.sleep(0.1)
-
-        if self.process.poll() is not None:
-            stdout, stderr = self.process.communicate()
-            raise RuntimeError(
-                f"Server process failed to start:\nstdout: {stdout}\nstderr: {stderr}"
-            )
+        # Wait until the server answers an initialize request
+        try:
+            self.send_request(INITIALIZE_PROBE, timeout=timeout)
+        except (RuntimeError, TimeoutError, ValueError) as e:
+            self.stop()
+            raise RuntimeError(f"Server process failed to start: {e}") from e
 
     def stop(self) -> None:
         """Stop the MCP server subprocess."""
         if self.process:
-            self.process.terminate()
+            # Closing stdin is a clean shutdown and much quicker than SIGTERM
+            self.process.stdin.close()
             try:
-                self.process.wait(timeout=2.0)
+                self.process.wait(timeout=0.5)
             except subprocess.TimeoutExpired:
                 self.process.kill()
-                self.process.wait()
+                self.process.wait(timeout=0.5)
+            LIVE_SERVER_PROCESSES.discard(self.process)
             self.process = None
-
-        # Restore original clipboard content
-        try:
-            pyperclip.copy(self.original_clipboard)
-        except Exception:
-            pass  # Best effort restore
+        if self._reader is not None:
+            # The reader stops at EOF once the server has exited
+            self._reader.join(timeout=0.5)
+            self._reader = None
+        if self.stderr_file is not None:
+            self.stderr_file.close()
+            self.stderr_file = None
 
     def send_request(
         self, request: Dict[str, Any], timeout: float = 5.0
@@ -69,32 +95,22 @@ class MCPServerProcess:
         if not self.process:
             raise RuntimeError("Server process not started")
 
-        request_line = json.dumps(request) + "\n"
-
         try:
-            self.process.stdin.write(request_line)
+            # Two writes instead of copying the payload to append a newline
+            self.process.stdin.writelines((json.dumps(request), "\n"))
             self.process.stdin.flush()
         except BrokenPipeError:
             raise RuntimeError("Failed to send request - server process terminated")
 
         # Read response with timeout
-        response_line = None
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            if self.process.stdout.readable():
-                response_line = self.process.stdout.readline()
-                if response_line:
-                    break
-            time.sleep(0.01)
+        response_line = self.readline(timeout)
 
         if not response_line:
             # Check if process is still alive
             if self.process.poll() is not None:
-                stdout, stderr = self.process.communicate()
-                raise RuntimeError(
-                    f"Server process terminated:\nstdout: {stdout}\nstderr: {stderr}"
-                )
+                self.stderr_file.seek(0)
+                stderr = self.stderr_file.read()
+                raise RuntimeError(f"Server process terminated:\nstderr: {stderr}")
             raise TimeoutError(f"No response received within {timeout} seconds")
 
         try:
@@ -102,6 +118,20 @@ class MCPServerProcess:
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON response: {response_line.strip()}") from e
 
+    def readline(self, timeout: float = 5.0) -> Optional[str]:
+        """Read one line from the server, or return None on timeout."""
+        try:
+            return self._lines.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    @staticmethod
+    def _read_stdout(stdout: IO[str], lines: "queue.Queue[str]") -> None:
+        """Queue each line of server output, then an empty string at EOF."""
+        for line in stdout:
+            lines.put(line)
+        lines.put("")
+
     def __enter__(self):
         """Context manager entry."""
         self.start()
@@ -113,15 +143,32 @@ class MCPServerProcess:
         return False
 
 
-@pytest.fixture
-def mcp_server():
-    """Fixture to provide an MCP server subprocess."""
+@pytest.fixture(scope="module")
+def shared_mcp_server():
+    """Fixture to provide one MCP server subprocess for the whole module."""
     server = MCPServerProcess()
     server.start()
     yield server
     server.stop()
 
 
+@pytest.fixture
+def mcp_server(request, shared_mcp_server):
+    """Fixture to provide an MCP server, fresh for tests marked fresh_server."""
+    if request.node.get_closest_marker("fresh_server"):
+        with MCPServerProcess() as server:
+            yield server
+        return
+
+    # Replace the shared server if an earlier test left it dead
+    process = shared_mcp_server.process
+    if process is None or process.poll() is not None:
+        shared_mcp_server.stop()
+        shared_mcp_server.start()
+    yield shared_mcp_server
+
+
+@pytest.mark.fresh_server
 def test_server_startup_and_shutdown(mcp_server):
     """Test that the server starts and can be shutdown cleanly."""
     # Server should be running
@@ -183,7 +230,7 @@ def test_tools_list_request(mcp_server):
 
 
 @pytest.mark.serial
-def test_get_clipboard_tool(mcp_server):
+def test_get_clipboard_tool(mcp_server, clipboard_backup):
     """Test the get_clipboard tool."""
     # Initialize first
     init_request = {
@@ -226,7 +273,7 @@ def test_get_clipboard_tool(mcp_server):
 
 
 @pytest.mark.serial
-def test_set_clipboard_tool(mcp_server):
+def test_set_clipboard_tool(mcp_server, clipboard_backup):
     """Test the set_clipboard tool."""
     # Initialize first
     init_request = {
@@ -257,12 +304,13 @@ def test_set_clipboard_tool(mcp_server):
     assert "result" in response
     assert "content" in response["result"]
 
-    # Verify the clipboard was actually set
+    # Wire-level check: the one place the system clipboard is read directly
     actual_clipboard = pyperclip.paste()
     assert actual_clipboard == test_text
 
 
-def test_unicode_content(mcp_server):
+@pytest.mark.serial
+def test_unicode_content(mcp_server, clipboard_backup):
     """Test Unicode and emoji content handling."""
     # Initialize first
     init_request = {
@@ -277,12 +325,6 @@ def test_unicode_content(mcp_server):
     }
     mcp_server.send_request(init_request)
 
-    # Clear clipboard first to ensure test isolation
-    try:
-        pyperclip.copy("")
-    except Exception:
-        pass
-
     # Test with various Unicode characters and emoji
     unicode_text = "Hello 世界! 🌍🚀 Ñoël ñ français αβγδε"
     set_request = {
@@ -295,14 +337,15 @@ def test_unicode_content(mcp_server):
     response = mcp_server.send_request(set_request)
     assert "result" in response
 
-    # Give a small delay to ensure clipboard is set
-    import time
-
-    time.sleep(0.1)
-
-    # Verify Unicode content is preserved
-    actual_clipboard = pyperclip.paste()
-    assert actual_clipboard == unicode_text
+    # Verify Unicode content is preserved through the MCP round trip
+    get_request = {
+        "jsonrpc": "2.0",
+        "id": 3,
+        "method": "tools/call",
+        "params": {"name": "get_clipboard", "arguments": {}},
+    }
+    response = mcp_server.send_request(get_request)
+    assert response["result"]["content"][0]["text"] == unicode_text
 
 
 def test_large_text_validation(mcp_server):
@@ -363,7 +406,7 @@ def test_malformed_json_recovery(mcp_server):
         mcp_server.process.stdin.flush()
 
         # Read error response
-        response_line = mcp_server.process.stdout.readline()
+        response_line = mcp_server.readline()
         error_response = json.loads(response_line.strip())
 
         assert error_response["jsonrpc"] == "2.0"
@@ -435,21 +478,21 @@ def test_ping_notification(mcp_server):
     ping_notification = {"jsonrpc": "2.0", "method": "$/ping", "params": {}}
 
     # Send ping - should not get a response
-    mcp_server.process.stdin.write(json.dumps(ping_notification) + "\n")
+    mcp_server.process.stdin.writelines((json.dumps(ping_notification), "\n"))
     mcp_server.process.stdin.flush()
 
-    # Give time for any potential response
-    time.sleep(0.1)
-
-    # Server should still be responsive
+    # Server should still be responsive. Requests are answered in order, so a
+    # reply to the ping would arrive first and fail the id check; no wait needed
     tools_request = {"jsonrpc": "2.0", "id": 2, "method": "tools/list", "params": {}}
 
     response = mcp_server.send_request(tools_request)
+    assert response["id"] == 2
     assert "result" in response
 
 
+@pytest.mark.serial
 @pytest.mark.timeout(10)
-def test_stress_multiple_requests(mcp_server):
+def test_stress_multiple_requests(mcp_server, clipboard_backup):
     """Test handling multiple rapid requests."""
     # Initialize first
     init_request = {
@@ -524,7 +567,7 @@ def test_platform_detection_windows():
 
 
 @pytest.mark.serial
-def test_cross_platform_unicode_content():
+def test_cross_platform_unicode_content(clipboard_backup):
     """Test Unicode content handling across platforms."""
     unicode_content = "Hello, 世界! 🌍 Café naïve résumé"
 
@@ -568,7 +611,8 @@ def test_cross_platform_unicode_content():
                 assert content == unicode_content or content == ""
 
 
-def test_large_content_handling():
+@pytest.mark.serial
+def test_large_content_handling(clipboard_backup):
     """Test handling of large clipboard content."""
     # Create content near the validation limit
     large_content = "A" * (1024 * 100)  # 100KB
@@ -1,19 +1,32 @@
 """Tests for JSON-RPC protocol handling."""
 
 import json
+import sys
 
 import pytest
+from mcp_clipboard_server import protocol
 from mcp_clipboard_server._errors import ErrorCodes
 from mcp_clipboard_server.protocol import (
     JsonRpcError,
     JsonRpcRequest,
     JsonRpcResponse,
+    create_batch_response,
     create_error_response,
     create_success_response,
+    create_success_response_from_json,
+    json_dumps,
     parse_json_rpc_message,
 )
 
 
+@pytest.fixture(params=[False, True], ids=["stdlib", "orjson"])
+def json_backend(request, monkeypatch):
+    """Run a JSON codec test with and without orjson."""
+    if request.param and not hasattr(protocol, "orjson"):
+        pytest.skip("orjson is not installed")
+    monkeypatch.setattr(protocol, "HAS_ORJSON", request.param)
+
+
 class TestJsonRpcRequest:
     """Test JsonRpcRequest class."""
 
@@ -84,6 +97,7 @@ class TestJsonRpcResponse:
         assert result == expected
 
 
+@pytest.mark.usefixtures("json_backend")
 class TestParseJsonRpcMessage:
     """Test JSON-RPC message parsing."""
 
@@ -95,37 +109,50 @@ class TestParseJsonRpcMessage:
         assert request.method == "test"
         assert request.id == 1
 
-    def test_parse_invalid_json(self):
-        """Test parsing malformed JSON."""
-        data = '{"jsonrpc": "2.0", "method":'
-        with pytest.raises(ValueError, match="Parse error"):
-            parse_json_rpc_message(data)
-
-    def test_parse_non_object(self):
-        """Test parsing JSON array instead of object."""
-        data = '["not", "an", "object"]'
-        with pytest.raises(
-            ValueError, match="Invalid request: batch items must be JSON objects"
-        ):
-            parse_json_rpc_message(data)
-
-    def test_parse_missing_jsonrpc(self):
-        """Test parsing message without jsonrpc field."""
-        data = '{"method": "test", "id": 1}'
-        with pytest.raises(ValueError, match="Invalid request: jsonrpc must be '2.0'"):
+    def test_parse_interns_method(self):
+        """Test that parsed method names are interned."""
+        data = '{"jsonrpc": "2.0", "method": "tools/list", "id": 1}'
+        request = parse_json_rpc_message(data)
+        assert request.method is sys.intern("tools/list")
+
+    @pytest.mark.parametrize(
+        "data,error",
+        [
+            ('{"jsonrpc": "2.0", "method":', "Parse error"),
+            (
+                '["not", "an", "object"]',
+                "Invalid request: batch items must be JSON objects",
+            ),
+            ('{"method": "test", "id": 1}', "Invalid request: jsonrpc must be '2.0'"),
+            (
+                '{"jsonrpc": "1.0", "method": "test", "id": 1}',
+                "Invalid request: jsonrpc must be '2.0'",
+            ),
+            ('{"jsonrpc": "2.0", "id": 1}', "Invalid request: missing method"),
+        ],
+        ids=[
+            "invalid-json",
+            "non-object",
+            "missing-jsonrpc",
+            "wrong-jsonrpc-version",
+            "missing-method",
+        ],
+    )
+    def test_parse_rejects(self, data, error):
+        """Test that malformed messages raise a descriptive ValueError."""
+        with pytest.raises(ValueError, match=error):
             parse_json_rpc_message(data)
 
-    def test_parse_wrong_jsonrpc_version(self):
-        """Test parsing message with wrong jsonrpc version."""
-        data = '{"jsonrpc": "1.0", "method": "test", "id": 1}'
-        with pytest.raises(ValueError, match="Invalid request: jsonrpc must be '2.0'"):
-            parse_json_rpc_message(data)
+    def test_parse_large_int_id(self):
+        """Test parsing IDs outside orjson's native integer range."""
+        request_id = 2**70 + 1
+        data = '{"jsonrpc": "2.0", "method": "test", "id": %d}' % request_id
+        request = parse_json_rpc_message(data)
+        assert type(request.id) is int  # pylint: disable=unidiomatic-typecheck
+        assert request.id == request_id
 
-    def test_parse_missing_method(self):
-        """Test parsing message without method field."""
-        data = '{"jsonrpc": "2.0", "id": 1}'
-        with pytest.raises(ValueError, match="Invalid request: missing method"):
-            parse_json_rpc_message(data)
+        (batch_request,) = parse_json_rpc_message("[%s]" % data)
+        assert batch_request.id == request_id
 
     def test_parse_notification(self):
         """Test parsing notification (no id field)."""
@@ -134,43 +161,42 @@ class TestParseJsonRpcMessage:
         assert request.id is None
 
 
+@pytest.mark.usefixtures("json_backend")
 class TestResponseCreation:
     """Test response creation functions."""
 
+    EXPECTED_SUCCESS = {"jsonrpc": "2.0", "id": 1, "result": {"data": "test"}}
+    EXPECTED_ERROR_MINIMAL = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "error": {"code": -32600, "message": "Invalid Request"},
+    }
+    EXPECTED_ERROR_WITH_DATA = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "error": {
+            "code": -32602,
+            "message": "Invalid params",
+            "data": {"field": "missing"},
+        },
+    }
+
     def test_create_success_response(self):
         """Test creating success response."""
         response_json = create_success_response(1, {"data": "test"})
-        response = json.loads(response_json)
-        expected = {"jsonrpc": "2.0", "id": 1, "result": {"data": "test"}}
-        assert response == expected
+        assert json.loads(response_json) == self.EXPECTED_SUCCESS
 
     def test_create_error_response_minimal(self):
         """Test creating error response without data."""
         response_json = create_error_response(1, -32600, "Invalid Request")
-        response = json.loads(response_json)
-        expected = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "error": {"code": -32600, "message": "Invalid Request"},
-        }
-        assert response == expected
+        assert json.loads(response_json) == self.EXPECTED_ERROR_MINIMAL
 
     def test_create_error_response_with_data(self):
         """Test creating error response with additional data."""
         response_json = create_error_response(
             1, -32602, "Invalid params", {"field": "missing"}
         )
-        response = json.loads(response_json)
-        expected = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "error": {
-                "code": -32602,
-                "message": "Invalid params",
-                "data": {"field": "missing"},
-            },
-        }
-        assert response == expected
+        assert json.loads(response_json) == self.EXPECTED_ERROR_WITH_DATA
 
     def test_response_with_string_id(self):
         """Test responses with string IDs."""
@@ -178,6 +204,38 @@ class TestResponseCreation:
         response = json.loads(response_json)
         assert response["id"] == "test-id"
 
+    def test_success_response_id_types(self):
+        """Test success responses encode every JSON-RPC ID type."""
+        for request_id in (7, "quoted \"id\"", None, True):
+            response = json.loads(create_success_response(request_id, "ok"))
+            assert response["id"] == request_id
+
+    def test_success_response_from_json(self):
+        """Test splicing a pre-serialized result matches full encoding."""
+        result = {"tools": [{"name": "x"}]}
+        response = create_success_response_from_json("a", json.dumps(result))
+        assert json.loads(response) == json.loads(create_success_response("a", result))
+
+    def test_create_batch_response(self):
+        """Test batch responses splice members and drop notifications."""
+        first = create_success_response(1, "ok")
+        second = create_error_response(2, -32601, "Method not found")
+
+        batch = create_batch_response([first, None, second])
+
+        assert json.loads(batch) == [json.loads(first), json.loads(second)]
+        assert create_batch_response([None, None]) == ""
+
+    def test_wire_format_is_compact(self):
+        """Test responses are byte-identical whichever JSON backend is used."""
+        response = create_success_response(1, {"data": ["a", 2]})
+        assert response == '{"jsonrpc":"2.0","id":1,"result":{"data":["a",2]}}'
+
+    def test_json_dumps_large_int(self):
+        """Test serialization of values outside orjson's native range."""
+        value = {"n": 2**70, "s": "é"}
+        assert json.loads(json_dumps(value)) == value
+
     def test_response_with_null_id(self):
         """Test responses with null ID."""
         response_json = create_error_response(None, -32700, "Parse error")
@@ -188,11 +246,16 @@ class TestResponseCreation:
 class TestErrorCodes:
     """Test error code constants."""
 
+    EXPECTED_ERROR_CODES = {
+        "PARSE_ERROR": -32700,
+        "INVALID_REQUEST": -32600,
+        "METHOD_NOT_FOUND": -32601,
+        "INVALID_PARAMS": -32602,
+        "INTERNAL_ERROR": -32603,
+        "SERVER_ERROR": -32000,
+    }
+
     def test_error_codes_defined(self):
         """Test that all required error codes are defined."""
-        assert ErrorCodes.PARSE_ERROR == -32700
-        assert ErrorCodes.INVALID_REQUEST == -32600
-        assert ErrorCodes.METHOD_NOT_FOUND == -32601
-        assert ErrorCodes.INVALID_PARAMS == -32602
-        assert ErrorCodes.INTERNAL_ERROR == -32603
-        assert ErrorCodes.SERVER_ERROR == -32000
+        actual = {name: getattr(ErrorCodes, name) for name in self.EXPECTED_ERROR_CODES}
+        assert actual == self.EXPECTED_ERROR_CODES
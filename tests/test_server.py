@@ -3,25 +3,66 @@
 import json
 from unittest.mock import patch
 
+import pytest
 from mcp_clipboard_server._errors import ErrorCodes
+from mcp_clipboard_server._version import __version__
+from mcp_clipboard_server.clipboard import ClipboardError
 from mcp_clipboard_server.protocol import JsonRpcRequest
 from mcp_clipboard_server.server import MCPServer
 
 
+@pytest.fixture(scope="module")
+def shared_server():
+    """Build one server for the whole module."""
+    return MCPServer()
+
+
+@pytest.fixture
+def server(shared_server):
+    """Hand each test the shared server, reset to its uninitialized state."""
+    shared_server.initialized = False
+    return shared_server
+
+
 class TestMCPServer:
     """Test MCP server functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.server = MCPServer()
-
-    def test_initialization(self):
+    EXPECTED_TOOLS = [
+        {
+            "name": "get_clipboard",
+            "description": "Get the current text content from the system clipboard",
+            "inputSchema": {
+                "type": "object",
+                "properties": {},
+                "required": [],
+                "additionalProperties": False,
+            },
+        },
+        {
+            "name": "set_clipboard",
+            "description": "Set the system clipboard to the provided text content",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "text": {
+                        "type": "string",
+                        "description": "The text content to copy to the clipboard",
+                        "maxLength": 1048576,
+                    }
+                },
+                "required": ["text"],
+                "additionalProperties": False,
+            },
+        },
+    ]
+
+    def test_initialization(self, server):
         """Test server initialization state."""
-        assert not self.server.initialized
-        assert self.server.server_info["name"] == "mcp-clipboardify"
-        assert "tools" in self.server.capabilities
+        assert not server.initialized
+        assert server.server_info["name"] == "mcp-clipboardify"
+        assert "tools" in server.capabilities
 
-    def test_handle_initialize(self):
+    def test_handle_initialize(self, server):
         """Test initialize request handling."""
         request = JsonRpcRequest(
             jsonrpc="2.0",
@@ -30,52 +71,82 @@ class TestMCPServer:
             params={"clientInfo": {"name": "test-client"}},
         )
 
-        response_json = self.server.handle_initialize(request)
-        response = json.loads(response_json)
+        response_json = server.handle_initialize(request)
 
-        assert response["jsonrpc"] == "2.0"
-        assert response["id"] == 1
-        assert "result" in response
-        assert "serverInfo" in response["result"]
-        assert "capabilities" in response["result"]
-        assert self.server.initialized
+        assert json.loads(response_json) == {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {
+                "protocolVersion": "2024-11-05",
+                "serverInfo": {"name": "mcp-clipboardify", "version": __version__},
+                "capabilities": {"tools": {}},
+            },
+        }
+        assert server.initialized
 
-    def test_handle_initialize_without_params(self):
+    def test_handle_initialize_without_params(self, server):
         """Test initialize without client info."""
         request = JsonRpcRequest(jsonrpc="2.0", method="initialize", id=1)
 
-        response_json = self.server.handle_initialize(request)
+        response_json = server.handle_initialize(request)
         response = json.loads(response_json)
 
         assert "error" not in response
-        assert self.server.initialized
-
-    def test_handle_tools_list_not_initialized(self):
-        """Test tools/list before initialization."""
-        request = JsonRpcRequest(jsonrpc="2.0", method="tools/list", id=2)
-
-        response_json = self.server.handle_tools_list(request)
-        response = json.loads(response_json)
-
-        assert "error" in response
-        assert response["error"]["code"] == ErrorCodes.SERVER_ERROR
-
-    def test_handle_tools_list_initialized(self):
+        assert server.initialized
+
+    @pytest.mark.parametrize(
+        "method,params,initialized,expected_code",
+        [
+            ("tools/list", None, False, ErrorCodes.SERVER_ERROR),
+            (
+                "tools/call",
+                {"name": "get_clipboard", "arguments": {}},
+                False,
+                ErrorCodes.SERVER_ERROR,
+            ),
+            ("tools/call", None, True, ErrorCodes.INVALID_PARAMS),
+            ("tools/call", {"arguments": {}}, True, ErrorCodes.INVALID_PARAMS),
+            ("unknown/method", None, True, ErrorCodes.METHOD_NOT_FOUND),
+        ],
+        ids=[
+            "tools-list-not-initialized",
+            "tools-call-not-initialized",
+            "tools-call-missing-params",
+            "tools-call-missing-name",
+            "unknown-method",
+        ],
+    )
+    def test_request_errors(self, server, method, params, initialized, expected_code):
+        """Test that rejected requests get the matching JSON-RPC error code."""
+        server.initialized = initialized
+        request = JsonRpcRequest(jsonrpc="2.0", method=method, id=3, params=params)
+
+        response = json.loads(server.handle_request(request))
+
+        assert response["id"] == 3
+        assert response["error"]["code"] == expected_code
+
+    def test_handle_tools_list_initialized(self, server):
         """Test tools/list after initialization."""
-        self.server.initialized = True
+        server.initialized = True
 
         request = JsonRpcRequest(jsonrpc="2.0", method="tools/list", id=2)
 
-        response_json = self.server.handle_tools_list(request)
-        response = json.loads(response_json)
+        response = json.loads(server.handle_tools_list(request))
 
-        assert "error" not in response
-        assert "result" in response
-        assert "tools" in response["result"]
         assert len(response["result"]["tools"]) == 2
+        assert response == {
+            "jsonrpc": "2.0",
+            "id": 2,
+            "result": {"tools": self.EXPECTED_TOOLS},
+        }
+
+    @patch("mcp_clipboard_server._clipboard_utils.get_clipboard")
+    def test_handle_tools_call_wire_format(self, mock_get_clipboard, server):
+        """Test that tools/call responses use the compact wire format."""
+        server.initialized = True
+        mock_get_clipboard.return_value = "test content"
 
-    def test_handle_tools_call_not_initialized(self):
-        """Test tools/call before initialization."""
         request = JsonRpcRequest(
             jsonrpc="2.0",
             method="tools/call",
@@ -83,42 +154,15 @@ class TestMCPServer:
             params={"name": "get_clipboard", "arguments": {}},
         )
 
-        response_json = self.server.handle_tools_call(request)
-        response = json.loads(response_json)
-
-        assert "error" in response
-        assert response["error"]["code"] == ErrorCodes.SERVER_ERROR
-
-    def test_handle_tools_call_missing_params(self):
-        """Test tools/call without parameters."""
-        self.server.initialized = True
-
-        request = JsonRpcRequest(jsonrpc="2.0", method="tools/call", id=3)
-
-        response_json = self.server.handle_tools_call(request)
-        response = json.loads(response_json)
-
-        assert "error" in response
-        assert response["error"]["code"] == ErrorCodes.INVALID_PARAMS
-
-    def test_handle_tools_call_missing_name(self):
-        """Test tools/call without tool name."""
-        self.server.initialized = True
-
-        request = JsonRpcRequest(
-            jsonrpc="2.0", method="tools/call", id=3, params={"arguments": {}}
+        assert server.handle_tools_call(request) == (
+            '{"jsonrpc":"2.0","id":3,'
+            '"result":{"content":[{"type":"text","text":"test content"}]}}'
         )
 
-        response_json = self.server.handle_tools_call(request)
-        response = json.loads(response_json)
-
-        assert "error" in response
-        assert response["error"]["code"] == ErrorCodes.INVALID_PARAMS
-
     @patch("mcp_clipboard_server._clipboard_utils.get_clipboard")
-    def test_handle_tools_call_success(self, mock_get_clipboard):
+    def test_handle_tools_call_success(self, mock_get_clipboard, server):
         """Test successful tools/call."""
-        self.server.initialized = True
+        server.initialized = True
         mock_get_clipboard.return_value = "test content"
 
         request = JsonRpcRequest(
@@ -128,19 +172,39 @@ class TestMCPServer:
             params={"name": "get_clipboard", "arguments": {}},
         )
 
-        response_json = self.server.handle_tools_call(request)
+        response_json = server.handle_tools_call(request)
         response = json.loads(response_json)
 
         assert "error" not in response
         assert "result" in response
         mock_get_clipboard.assert_called_once()
+        assert response == {
+            "jsonrpc": "2.0",
+            "id": 3,
+            "result": {"content": [{"type": "text", "text": "test content"}]},
+        }
 
     @patch("mcp_clipboard_server._clipboard_utils.get_clipboard")
-    def test_handle_tools_call_tool_error(self, mock_get_clipboard):
-        """Test tools/call with tool execution error."""
-        self.server.initialized = True
-        from mcp_clipboard_server.clipboard import ClipboardError
+    def test_handle_tools_call_null_arguments(self, mock_get_clipboard, server):
+        """Test that null arguments are treated like validate_tool_params does."""
+        server.initialized = True
+        mock_get_clipboard.return_value = "test content"
+
+        request = JsonRpcRequest(
+            jsonrpc="2.0",
+            method="tools/call",
+            id=3,
+            params={"name": "get_clipboard", "arguments": None},
+        )
+
+        response = json.loads(server.handle_tools_call(request))
 
+        assert response["result"]["content"][0]["text"] == "test content"
+
+    @patch("mcp_clipboard_server._clipboard_utils.get_clipboard")
+    def test_handle_tools_call_tool_error(self, mock_get_clipboard, server):
+        """Test tools/call with tool execution error."""
+        server.initialized = True
         mock_get_clipboard.side_effect = ClipboardError("Clipboard error")
 
         request = JsonRpcRequest(
@@ -150,37 +214,88 @@ class TestMCPServer:
             params={"name": "get_clipboard", "arguments": {}},
         )
 
-        response_json = self.server.handle_tools_call(request)
+        response_json = server.handle_tools_call(request)
         response = json.loads(response_json)
 
         assert "error" in response
         assert response["error"]["code"] == -32001  # CLIPBOARD_ERROR
 
-    def test_handle_ping(self):
+    @patch("mcp_clipboard_server._clipboard_utils.set_clipboard")
+    def test_handle_tools_call_text_too_long(self, mock_set_clipboard, server):
+        """Test that oversized text is rejected before touching the clipboard."""
+        server.initialized = True
+
+        request = JsonRpcRequest(
+            jsonrpc="2.0",
+            method="tools/call",
+            id=3,
+            params={
+                "name": "set_clipboard",
+                "arguments": {"text": "a" * (1024 * 1024 + 1)},
+            },
+        )
+
+        response_json = server.handle_tools_call(request)
+        response = json.loads(response_json)
+
+        assert response["error"]["code"] == ErrorCodes.INVALID_PARAMS
+        assert len(response_json) < 1024
+        mock_set_clipboard.assert_not_called()
+
+    def test_handle_ping(self, server):
         """Test ping notification handling."""
         request = JsonRpcRequest(jsonrpc="2.0", method="$/ping", id=None)
 
-        response = self.server.handle_ping(request)
+        response = server.handle_ping(request)
         assert response is None
 
-    def test_handle_unknown_method_with_id(self):
-        """Test unknown method with ID (should return error)."""
-        request = JsonRpcRequest(jsonrpc="2.0", method="unknown/method", id=999)
+    @patch("mcp_clipboard_server.server.log_response")
+    @patch("mcp_clipboard_server.server.log_request")
+    def test_handle_request_notification_fast_path(
+        self, mock_log_req, mock_log_resp, server
+    ):
+        """Test that notifications skip request/response logging."""
+        request = JsonRpcRequest(jsonrpc="2.0", method="$/ping", id=None)
 
-        response_json = self.server.handle_request(request)
-        response = json.loads(response_json)
+        response = server.handle_request(request)
 
-        assert "error" in response
-        assert response["error"]["code"] == ErrorCodes.METHOD_NOT_FOUND
+        assert response is None
+        mock_log_req.assert_not_called()
+        mock_log_resp.assert_not_called()
+
+    def test_handle_request_notification_error(self, server):
+        """Test that a failing notification handler never produces a response."""
+        request = JsonRpcRequest(jsonrpc="2.0", method="$/ping", id=None)
+
+        with patch.object(
+            server.mcp_handler, "handle_request", side_effect=RuntimeError("boom")
+        ):
+            response = server.handle_request(request)
+
+        assert response is None
+
+    def test_handle_request_exception_wire_format(self, server):
+        """Test that handler exceptions become compact error responses."""
+        request = JsonRpcRequest(jsonrpc="2.0", method="tools/list", id=4)
+
+        with patch.object(
+            server.mcp_handler, "handle_request", side_effect=RuntimeError("boom")
+        ):
+            response = server.handle_request(request)
+
+        assert response == (
+            '{"jsonrpc":"2.0","id":4,"error":{"code":%d,"message":"boom"}}'
+            % ErrorCodes.SERVER_ERROR
+        )
 
-    def test_handle_unknown_notification(self):
+    def test_handle_unknown_notification(self, server):
         """Test unknown notification (should be ignored)."""
         request = JsonRpcRequest(jsonrpc="2.0", method="unknown/notification", id=None)
 
-        response = self.server.handle_request(request)
+        response = server.handle_request(request)
         assert response is None
 
-    def test_full_mcp_handshake(self):
+    def test_full_mcp_handshake(self, server):
         """Test complete MCP handshake sequence."""
         # 1. Initialize
         init_request = JsonRpcRequest(
@@ -190,7 +305,7 @@ class TestMCPServer:
             params={"protocolVersion": "2024-11-05"},
         )
 
-        init_response = self.server.handle_request(init_request)
+        init_response = server.handle_request(init_request)
         assert (
             json.loads(init_response)["result"]["serverInfo"]["name"]
             == "mcp-clipboardify"
@@ -199,7 +314,7 @@ class TestMCPServer:
         # 2. List tools
         list_request = JsonRpcRequest(jsonrpc="2.0", method="tools/list", id=2)
 
-        list_response = self.server.handle_request(list_request)
+        list_response = server.handle_request(list_request)
         tools = json.loads(list_response)["result"]["tools"]
         assert len(tools) == 2
 
@@ -216,6 +331,6 @@ class TestMCPServer:
                 params={"name": "get_clipboard", "arguments": {}},
             )
 
-            call_response = self.server.handle_request(call_request)
+            call_response = server.handle_request(call_request)
             result = json.loads(call_response)["result"]
             assert result["content"][0]["text"] == "clipboard content"
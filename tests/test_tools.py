@@ -1,8 +1,10 @@
 """Tests for MCP tool implementations."""
 
-from unittest.mock import patch
+import json
+from unittest.mock import MagicMock
 
 import pytest
+from mcp_clipboard_server import _clipboard_utils, clipboard
 from mcp_clipboard_server._errors import ErrorCodes
 from mcp_clipboard_server._tool_schemas import get_all_tool_definitions
 from mcp_clipboard_server.clipboard import ClipboardError
@@ -10,31 +12,50 @@ from mcp_clipboard_server.tools import (
     execute_tool,
     get_tool_error_code,
     list_tools,
+    list_tools_json,
     validate_tool_params,
 )
 
 
+@pytest.fixture
+def mock_get(monkeypatch):
+    """Replace the clipboard read used by the tool executors with a MagicMock."""
+    mock = MagicMock()
+    monkeypatch.setattr(_clipboard_utils, "get_clipboard", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_set(monkeypatch):
+    """Replace the clipboard write used by the tool executors with a MagicMock."""
+    mock = MagicMock()
+    monkeypatch.setattr(_clipboard_utils, "set_clipboard", mock)
+    return mock
+
+
 class TestToolDefinitions:
     """Test tool schema definitions."""
 
-    def test_tools_defined(self):
+    @pytest.fixture(scope="class")
+    def tool_definitions(self):
+        """Fetch the tool definitions once for the whole class."""
+        return get_all_tool_definitions()
+
+    def test_tools_defined(self, tool_definitions):
         """Test that both required tools are defined."""
-        tool_definitions = get_all_tool_definitions()
         assert "get_clipboard" in tool_definitions
         assert "set_clipboard" in tool_definitions
 
-    def test_get_clipboard_schema(self):
+    def test_get_clipboard_schema(self, tool_definitions):
         """Test get_clipboard tool schema."""
-        tool_definitions = get_all_tool_definitions()
         tool = tool_definitions["get_clipboard"]
         assert tool["name"] == "get_clipboard"
         assert "description" in tool
         assert tool["inputSchema"]["type"] == "object"
         assert tool["inputSchema"]["properties"] == {}
 
-    def test_set_clipboard_schema(self):
+    def test_set_clipboard_schema(self, tool_definitions):
         """Test set_clipboard tool schema."""
-        tool_definitions = get_all_tool_definitions()
         tool = tool_definitions["set_clipboard"]
         assert tool["name"] == "set_clipboard"
         assert "description" in tool
@@ -49,7 +70,7 @@ class TestListTools:
         """Test that list_tools returns correct format."""
         result = list_tools()
         assert "tools" in result
-        assert isinstance(result["tools"], list)
+        assert isinstance(result["tools"], tuple)
         assert len(result["tools"]) == 2
 
     def test_list_tools_contains_all(self):
@@ -59,52 +80,66 @@ class TestListTools:
         assert "get_clipboard" in tool_names
         assert "set_clipboard" in tool_names
 
+    def test_list_tools_read_only(self):
+        """Test that list_tools returns one cached result callers cannot modify."""
+        result = list_tools()
 
-class TestValidateToolParams:
-    """Test parameter validation."""
-
-    def test_validate_unknown_tool(self):
-        """Test validation with unknown tool name."""
-        with pytest.raises(ValueError, match="Unknown tool"):
-            validate_tool_params("unknown_tool", {})
-
-    def test_validate_get_clipboard_no_params(self):
-        """Test get_clipboard with no parameters (valid)."""
-        validate_tool_params("get_clipboard", {})
-        validate_tool_params("get_clipboard", None)
-
-    def test_validate_get_clipboard_with_params(self):
-        """Test get_clipboard with parameters (invalid)."""
-        with pytest.raises(ValueError, match="does not accept parameters"):
-            validate_tool_params("get_clipboard", {"extra": "param"})
-
-    def test_validate_set_clipboard_valid(self):
-        """Test set_clipboard with valid parameters."""
-        validate_tool_params("set_clipboard", {"text": "hello"})
-
-    def test_validate_set_clipboard_missing_text(self):
-        """Test set_clipboard without text parameter."""
-        with pytest.raises(ValueError, match="requires 'text' parameter"):
-            validate_tool_params("set_clipboard", {})
+        assert list_tools() is result
+        with pytest.raises(TypeError):
+            result["tools"] = ()
+        assert json.loads(list_tools_json()) == {"tools": list(result["tools"])}
 
-        with pytest.raises(ValueError, match="requires 'text' parameter"):
-            validate_tool_params("set_clipboard", {"other": "param"})
 
-    def test_validate_set_clipboard_wrong_type(self):
-        """Test set_clipboard with non-string text."""
-        with pytest.raises(ValueError, match="must be a string"):
-            validate_tool_params("set_clipboard", {"text": 123})
+class TestValidateToolParams:
+    """Test parameter validation."""
 
-    def test_validate_set_clipboard_extra_params(self):
-        """Test set_clipboard with extra parameters."""
-        with pytest.raises(ValueError, match="Unexpected parameters"):
-            validate_tool_params("set_clipboard", {"text": "hello", "extra": "param"})
+    @pytest.mark.parametrize(
+        "tool,params",
+        [
+            ("get_clipboard", {}),
+            ("get_clipboard", None),
+            ("set_clipboard", {"text": "hello"}),
+        ],
+        ids=["get-empty", "get-none", "set-text"],
+    )
+    def test_validate_accepts(self, tool, params):
+        """Test that well-formed parameters pass validation."""
+        validate_tool_params(tool, params)
+
+    @pytest.mark.parametrize(
+        "tool,params,match",
+        [
+            ("unknown_tool", {}, "Unknown tool"),
+            ("get_clipboard", {"extra": "param"}, "Invalid parameters for get_"),
+            ("set_clipboard", {}, "Invalid parameters for set_clipboard: text"),
+            ("set_clipboard", None, "Invalid parameters for set_clipboard: text"),
+            ("set_clipboard", {"other": "param"}, "Invalid parameters for set_"),
+            ("set_clipboard", {"text": 123}, "Invalid parameters for set_clipboard"),
+            (
+                "set_clipboard",
+                {"text": "hello", "extra": "param"},
+                "Invalid parameters for set_clipboard",
+            ),
+        ],
+        ids=[
+            "unknown-tool",
+            "get-with-params",
+            "set-missing-text",
+            "set-none",
+            "set-other-param",
+            "set-wrong-type",
+            "set-extra-params",
+        ],
+    )
+    def test_validate_rejects(self, tool, params, match):
+        """Test that malformed parameters raise a descriptive ValueError."""
+        with pytest.raises(ValueError, match=match):
+            validate_tool_params(tool, params)
 
 
 class TestExecuteTool:
     """Test tool execution."""
 
-    @patch("mcp_clipboard_server._clipboard_utils.get_clipboard")
     def test_execute_get_clipboard_success(self, mock_get):
         """Test successful get_clipboard execution."""
         mock_get.return_value = "test content"
@@ -115,7 +150,17 @@ class TestExecuteTool:
         assert result["content"][0]["text"] == "test content"
         mock_get.assert_called_once()
 
-    @patch("mcp_clipboard_server._clipboard_utils.get_clipboard")
+    def test_execute_get_clipboard_empty(self, mock_get):
+        """Test that an empty clipboard result is not shared between calls."""
+        mock_get.return_value = ""
+
+        result = execute_tool("get_clipboard", {})
+        result["content"][0]["text"] = "changed"
+
+        assert execute_tool("get_clipboard", {}) == {
+            "content": [{"type": "text", "text": ""}]
+        }
+
     def test_execute_get_clipboard_failure(self, mock_get):
         """Test get_clipboard with clipboard error."""
         mock_get.side_effect = ClipboardError("Access denied")
@@ -123,7 +168,6 @@ class TestExecuteTool:
         with pytest.raises(RuntimeError, match="Clipboard operation failed"):
             execute_tool("get_clipboard", {})
 
-    @patch("mcp_clipboard_server._clipboard_utils.set_clipboard")
     def test_execute_set_clipboard_success(self, mock_set):
         """Test successful set_clipboard execution."""
         result = execute_tool("set_clipboard", {"text": "hello world"})
@@ -132,7 +176,15 @@ class TestExecuteTool:
         assert "Successfully copied 11 characters" in result["content"][0]["text"]
         mock_set.assert_called_once_with("hello world")
 
-    @patch("mcp_clipboard_server._clipboard_utils.set_clipboard")
+    def test_execute_set_clipboard_terse(self, monkeypatch, mock_set):
+        """Test set_clipboard reply when terse replies are enabled."""
+        monkeypatch.setattr(_clipboard_utils, "_TERSE_REPLIES", True)
+
+        result = execute_tool("set_clipboard", {"text": "hello world"})
+
+        assert result == {"content": [{"type": "text", "text": "ok"}]}
+        mock_set.assert_called_once_with("hello world")
+
     def test_execute_set_clipboard_failure(self, mock_set):
         """Test set_clipboard with clipboard error."""
         mock_set.side_effect = ClipboardError("Access denied")
@@ -140,6 +192,14 @@ class TestExecuteTool:
         with pytest.raises(RuntimeError, match="Clipboard operation failed"):
             execute_tool("set_clipboard", {"text": "hello"})
 
+    def test_execute_set_clipboard_rejected_text(self, mock_set):
+        """Test that input rejected by the clipboard layer stays a ValueError."""
+        mock_set.side_effect = ValueError("Text exceeds 1MB limit")
+
+        with pytest.raises(ValueError, match="exceeds 1MB") as exc_info:
+            execute_tool("set_clipboard", {"text": "hello"})
+        assert get_tool_error_code(exc_info.value) == ErrorCodes.INVALID_PARAMS
+
     def test_execute_invalid_tool(self):
         """Test execution with invalid tool name."""
         with pytest.raises(ValueError, match="Unknown tool"):
@@ -147,10 +207,9 @@ class TestExecuteTool:
 
     def test_execute_invalid_params(self):
         """Test execution with invalid parameters."""
-        with pytest.raises(ValueError, match="does not accept parameters"):
+        with pytest.raises(ValueError, match="Invalid parameters for get_clipboard"):
             execute_tool("get_clipboard", {"extra": "param"})
 
-    @patch("mcp_clipboard_server._clipboard_utils.get_clipboard")
     def test_execute_unexpected_error(self, mock_get):
         """Test handling of unexpected errors."""
         mock_get.side_effect = Exception("Unexpected error")
@@ -162,29 +221,23 @@ class TestExecuteTool:
 class TestGetToolErrorCode:
     """Test error code mapping."""
 
-    def test_value_error_mapping(self):
-        """Test that ValueError maps to INVALID_PARAMS."""
-        error = ValueError("Invalid parameter")
-        code = get_tool_error_code(error)
-        assert code == ErrorCodes.INVALID_PARAMS
-
-    def test_runtime_error_mapping(self):
-        """Test that RuntimeError maps to SERVER_ERROR."""
-        error = RuntimeError("Server error")
-        code = get_tool_error_code(error)
-        assert code == ErrorCodes.SERVER_ERROR
-
-    def test_generic_error_mapping(self):
-        """Test that generic exceptions map to SERVER_ERROR."""
-        error = Exception("Generic error")
-        code = get_tool_error_code(error)
-        assert code == ErrorCodes.SERVER_ERROR
+    @pytest.mark.parametrize(
+        "error,expected_code",
+        [
+            (ValueError("Invalid parameter"), ErrorCodes.INVALID_PARAMS),
+            (RuntimeError("Server error"), ErrorCodes.SERVER_ERROR),
+            (Exception("Generic error"), ErrorCodes.SERVER_ERROR),
+        ],
+        ids=["value-error", "runtime-error", "generic-error"],
+    )
+    def test_error_code_mapping(self, error, expected_code):
+        """Test that each exception type maps to its JSON-RPC error code."""
+        assert get_tool_error_code(error) == expected_code
 
 
 class TestPlatformSpecificIntegration:
     """Test platform-specific integration with tools."""
 
-    @patch("mcp_clipboard_server._clipboard_utils.get_clipboard")
     def test_execute_get_clipboard_platform_failure(self, mock_get):
         """Test get_clipboard execution with platform-specific failure."""
         # Simulate platform failure that returns empty string
@@ -196,7 +249,6 @@ class TestPlatformSpecificIntegration:
         assert result["content"][0]["text"] == ""
         mock_get.assert_called_once()
 
-    @patch("mcp_clipboard_server._clipboard_utils.set_clipboard")
     def test_execute_set_clipboard_platform_error(self, mock_set):
         """Test set_clipboard with enhanced platform error message."""
         enhanced_error = ClipboardError(
@@ -213,11 +265,11 @@ class TestPlatformSpecificIntegration:
         assert "Linux" in error_msg
         assert "Solution:" in error_msg
 
-    @patch("mcp_clipboard_server.clipboard._get_platform_info")
-    @patch("mcp_clipboard_server._clipboard_utils.set_clipboard")
-    def test_execute_with_wsl_error(self, mock_set, mock_platform):
+    def test_execute_with_wsl_error(self, monkeypatch, mock_set):
         """Test tool execution with WSL-specific error."""
-        mock_platform.return_value = "WSL (Windows Subsystem for Linux)"
+        monkeypatch.setattr(
+            clipboard, "_get_platform_info", lambda: "WSL (Windows Subsystem for Linux)"
+        )
         mock_set.side_effect = ClipboardError("WSL clipboard access limited")
 
         with pytest.raises(RuntimeError) as exc_info:
@@ -226,19 +278,15 @@ class TestPlatformSpecificIntegration:
         error_msg = str(exc_info.value)
         assert "WSL" in error_msg or "clipboard" in error_msg
 
-    def test_unicode_content_handling(self):
+    def test_unicode_content_handling(self, mock_get, mock_set):
         """Test handling of Unicode content through tools."""
         unicode_text = "Hello, 世界! 🌍 Café naïve résumé"
+        mock_get.return_value = unicode_text
 
-        with patch("mcp_clipboard_server._clipboard_utils.set_clipboard") as mock_set:
-            with patch(
-                "mcp_clipboard_server._clipboard_utils.get_clipboard",
-                return_value=unicode_text,
-            ):
-                # Test setting Unicode content
-                result = execute_tool("set_clipboard", {"text": unicode_text})
-                mock_set.assert_called_once_with(unicode_text)
-
-                # Test getting Unicode content
-                result = execute_tool("get_clipboard", {})
-                assert result["content"][0]["text"] == unicode_text
+        # Test setting Unicode content
+        result = execute_tool("set_clipboard", {"text": unicode_text})
+        mock_set.assert_called_once_with(unicode_text)
+
+        # Test getting Unicode content
+        result = execute_tool("get_clipboard", {})
+        assert result["content"][0]["text"] == unicode_text